@@ -2,6 +2,9 @@
 
 import json
 import re
+import threading
+import time
+from dataclasses import dataclass
 from datetime import datetime
 from typing import Any
 from urllib.parse import parse_qs, urlparse
@@ -13,6 +16,9 @@ from app_logger import ModuleLogger
 
 logger = ModuleLogger("AppleTVAPI")
 
+# Access tokens older than this (in seconds) are fetched again
+ACCESS_TOKEN_MAX_AGE = 60 * 60
+
 HEADERS = {
     "content-type": "application/json",
     "accept-encoding": "gzip, deflate, br",
@@ -62,6 +68,17 @@ class TrailerInfo:
         }
 
 
+@dataclass
+class _ContentRef:
+    """Content parsed from an Apple TV URL, kept per lookup."""
+
+    locale_code: str
+    kind: str
+    id: str
+    target_id: str | None = None
+    target_type: str | None = None
+
+
 class AppleTVPlus:
     """Client for interacting with Apple TV Plus API."""
 
@@ -70,11 +87,7 @@ class AppleTVPlus:
         self.session.headers = HEADERS.copy()
         self.locale = "en-US"
         self.storefront = "143441"  # US storefront
-        self.locale_code = "us"
-        self.kind = "movie"
-        self.id = ""
-        self.target_id: str | None = None
-        self.target_type: str | None = None
+        self._token_fetched_at: float | None = None
         self._get_access_token()
 
     def _get_access_token(self):
@@ -120,9 +133,7 @@ class AppleTVPlus:
                 if isinstance(data, list) and len(data) > 0:
                     access_token = self._find_token_recursive(data)
                     if access_token:
-                        self.session.headers.update(
-                            {"authorization": f"Bearer {access_token}"}
-                        )
+                        self._set_access_token(access_token)
                         logger.debug("Successfully obtained access token")
                         return
             except json.JSONDecodeError:
@@ -137,9 +148,7 @@ class AppleTVPlus:
                 )
                 if match:
                     access_token = match.group(1)
-                    self.session.headers.update(
-                        {"authorization": f"Bearer {access_token}"}
-                    )
+                    self._set_access_token(access_token)
                     logger.debug("Successfully obtained access token from script")
                     return
 
@@ -169,9 +178,31 @@ class AppleTVPlus:
     def _use_fallback_token(self):
         """Use fallback method to access API without token."""
         logger.debug("Using fallback API access method")
-        self.session.headers.pop("authorization", None)
+        self._set_access_token(None)
+
+    def _set_access_token(self, access_token: str | None) -> None:
+        """Set (or clear) the access token sent with API requests."""
+        # Replace the headers instead of updating them in place, the session
+        # may be sending a request from another thread at the same time
+        headers = HEADERS.copy()
+        if access_token:
+            headers["authorization"] = f"Bearer {access_token}"
+            self._token_fetched_at = time.monotonic()
+        else:
+            self._token_fetched_at = None
+        self.session.headers = headers
+
+    def needs_new_token(self) -> bool:
+        """Check if there is no access token or it is older than the max age."""
+        if self._token_fetched_at is None:
+            return True
+        return time.monotonic() - self._token_fetched_at > ACCESS_TOKEN_MAX_AGE
 
-    def _parse_url(self, url: str) -> bool:
+    def refresh_token(self) -> None:
+        """Fetch a new access token from Apple TV."""
+        self._get_access_token()
+
+    def _parse_url(self, url: str) -> _ContentRef | None:
         """Parse and validate the Apple TV+ URL."""
         logger.debug(f"Parsing Apple TV URL: {url}")
 
@@ -183,49 +214,42 @@ class AppleTVPlus:
 
         if u.netloc != "tv.apple.com":
             logger.error("URL is invalid! Host should be tv.apple.com!")
-            return False
+            return None
 
         path_parts = [p for p in u.path.split("/") if p]
 
         if len(path_parts) < 3:
             logger.error("URL format not recognized!")
-            return False
-
-        self.locale_code = path_parts[0]
-        self.kind = path_parts[1]
+            return None
 
-        if len(path_parts) >= 4:
-            self.id = path_parts[-1]
-        else:
-            self.id = path_parts[-1]
+        ref = _ContentRef(
+            locale_code=path_parts[0], kind=path_parts[1], id=path_parts[-1]
+        )
 
         query_params = parse_qs(u.query)
         if "targetId" in query_params:
-            self.target_id = query_params["targetId"][0]
-            self.target_type = query_params.get("targetType", ["Movie"])[0]
-        else:
-            self.target_id = None
-            self.target_type = None
+            ref.target_id = query_params["targetId"][0]
+            ref.target_type = query_params.get("targetType", ["Movie"])[0]
 
-        if self.kind in ["episode", "season"]:
-            self.kind = "show"
+        if ref.kind in ["episode", "season"]:
+            ref.kind = "show"
             if "showId" in query_params:
-                self.id = query_params["showId"][0]
-        elif self.kind == "clip":
-            if self.target_id:
-                self.id = self.target_id
-                self.kind = (
-                    self.target_type.lower() if self.target_type else "movie"
+                ref.id = query_params["showId"][0]
+        elif ref.kind == "clip":
+            if ref.target_id:
+                ref.id = ref.target_id
+                ref.kind = (
+                    ref.target_type.lower() if ref.target_type else "movie"
                 )
 
-        logger.debug(f"Parsed: kind={self.kind}, id={self.id}")
-        return True
+        logger.debug(f"Parsed: kind={ref.kind}, id={ref.id}")
+        return ref
 
-    def _get_api_data(self) -> dict[str, Any] | None:
+    def _get_api_data(self, ref: _ContentRef) -> dict[str, Any] | None:
         """Fetch content data from Apple TV+ API."""
         logger.debug("Fetching API response...")
 
-        api_url = f"https://tv.apple.com/api/uts/v3/{self.kind}s/{self.id}"
+        api_url = f"https://tv.apple.com/api/uts/v3/{ref.kind}s/{ref.id}"
         params = {
             "caller": "web",
             "locale": self.locale,
@@ -250,19 +274,19 @@ class AppleTVPlus:
 
         if r.status_code != 200:
             logger.debug(f"API returned status {r.status_code}, trying page scrape...")
-            return self._get_data_from_page()
+            return self._get_data_from_page(ref)
 
         try:
             return r.json()
         except json.JSONDecodeError:
             logger.error("Failed to parse API response as JSON")
-            return self._get_data_from_page()
+            return self._get_data_from_page(ref)
 
-    def _get_data_from_page(self) -> dict[str, Any] | None:
+    def _get_data_from_page(self, ref: _ContentRef) -> dict[str, Any] | None:
         """Fetch content data directly from Apple TV page HTML."""
         logger.debug("Fetching data from page HTML...")
 
-        page_url = f"https://tv.apple.com/{self.locale_code}/{self.kind}/-/{self.id}"
+        page_url = f"https://tv.apple.com/{ref.locale_code}/{ref.kind}/-/{ref.id}"
 
         try:
             r = requests.get(page_url, headers=HEADERS, timeout=30)
@@ -341,9 +365,9 @@ class AppleTVPlus:
             return date[:10]
         return datetime.now().strftime("%Y-%m-%d")
 
-    def _get_default_trailer(self) -> TrailerInfo | None:
+    def _get_default_trailer(self, ref: _ContentRef) -> TrailerInfo | None:
         """Get the default/main trailer for the content."""
-        data = self._get_api_data()
+        data = self._get_api_data(ref)
 
         if not data:
             logger.error("Failed to get API data")
@@ -390,15 +414,15 @@ class AppleTVPlus:
                 description=content.get("description", ""),
                 genres=self._parse_genres(content.get("genres", [])),
                 cover_url=cover_image,
-                apple_id=self.id,
+                apple_id=ref.id,
             )
         except Exception as e:
             logger.error(f"Error parsing API response: {e}")
             return None
 
-    def _get_all_trailers(self) -> list[TrailerInfo]:
+    def _get_all_trailers(self, ref: _ContentRef) -> list[TrailerInfo]:
         """Get all available trailers for the content."""
-        data = self._get_api_data()
+        data = self._get_api_data(ref)
 
         if not data:
             logger.error("Failed to get API data")
@@ -482,7 +506,7 @@ class AppleTVPlus:
                                     content.get("genres", [])
                                 ),
                                 cover_url=cover_image,
-                                apple_id=self.id,
+                                apple_id=ref.id,
                             )
                         )
                     except Exception as e:
@@ -490,7 +514,7 @@ class AppleTVPlus:
                         continue
 
             if not trailers:
-                default = self._get_default_trailer()
+                default = self._get_default_trailer(ref)
                 if default:
                     return [default]
 
@@ -498,18 +522,39 @@ class AppleTVPlus:
 
         except Exception as e:
             logger.error(f"Error getting trailers: {e}")
-            default = self._get_default_trailer()
+            default = self._get_default_trailer(ref)
             return [default] if default else []
 
     def get_trailers(
         self, url: str, default_only: bool = False
     ) -> list[TrailerInfo]:
         """Get trailer information for the given URL."""
-        if not self._parse_url(url):
+        ref = self._parse_url(url)
+        if not ref:
             return []
 
         if default_only:
-            result = self._get_default_trailer()
+            result = self._get_default_trailer(ref)
             return [result] if result else []
         else:
-            return self._get_all_trailers()
+            return self._get_all_trailers(ref)
+
+
+# Shared client, reuses the access token and HTTP session across lookups.
+# Lookups keep their state in locals, so they can run concurrently. The lock
+# only guards creating the client and refreshing its token.
+_shared_client: AppleTVPlus | None = None
+_shared_client_lock = threading.Lock()
+
+
+def get_trailers(url: str, default_only: bool = False) -> list[TrailerInfo]:
+    """Get trailer information for the given URL using a shared client."""
+    global _shared_client
+    with _shared_client_lock:
+        if _shared_client is None:
+            _shared_client = AppleTVPlus()
+        elif _shared_client.needs_new_token():
+            # Retry after a fallback (failed token fetch) or refresh an old one
+            _shared_client.refresh_token()
+        client = _shared_client
+    return client.get_trailers(url, default_only=default_only)
@@ -2,8 +2,14 @@
 
 import json
 import re
+import threading
+import time
+from collections import OrderedDict
 from datetime import datetime
-from typing import Any
+from functools import lru_cache, wraps
+from html import unescape
+from operator import itemgetter
+from typing import Any, Callable, Collection
 from urllib.parse import quote_plus, unquote, urlparse
 from unicodedata import normalize
 
@@ -12,7 +18,7 @@ from bs4 import BeautifulSoup
 
 from app_logger import ModuleLogger
 from core.base.database.models.media import MediaRead
-from core.download.apple.api import AppleTVPlus, TrailerInfo, HEADERS
+from core.download.apple.api import TrailerInfo, HEADERS, get_trailers
 
 logger = ModuleLogger("AppleTrailerSearch")
 
@@ -20,22 +26,118 @@ logger = ModuleLogger("AppleTrailerSearch")
 # This ensures we don't download trailers for wrong movies
 MINIMUM_TITLE_MATCH_SCORE = 50
 
+# Precompiled patterns for title normalization and slug generation
+_NON_WORD_RE = re.compile(r"[^\w\s]")
+_WHITESPACE_RE = re.compile(r"\s+")
+_SLUG_HYPHENS_RE = re.compile(r"-+")
+_DDG_REDIRECT_URL_RE = re.compile(r"uddg=([^&]+)")
+
+# Lowercases ASCII letters and digits, replaces everything else with hyphens
+_SLUG_TRANSLATION = str.maketrans(
+    {
+        chr(code): chr(code).lower() if chr(code).isalnum() else "-"
+        for code in range(128)
+    }
+)
+
+# Anchors and their attributes/text in DuckDuckGo result pages
+_HTML_ANCHOR_RE = re.compile(
+    r"<a\b([^>]*)>(.*?)</a>", re.IGNORECASE | re.DOTALL
+)
+_HTML_CLASS_RE = re.compile(
+    r"""(?:^|\s)class=["']([^"']*)["']""", re.IGNORECASE
+)
+_HTML_HREF_RE = re.compile(
+    r"""(?:^|\s)href=["']([^"']+)["']""", re.IGNORECASE
+)
+_HTML_TAG_RE = re.compile(r"<[^>]+>")
+
+# Matches apple.com (or subdomain) URLs of movie or TV season pages
+_ITUNES_CONTENT_URL_RE = re.compile(
+    r"^https?://(?:[\w-]+\.)*apple\.com/(?:[^?#]*/)?(?:movie|tv-season)/",
+    re.IGNORECASE,
+)
+
+# Shared session so repeated lookups reuse pooled keep-alive connections
+_session = requests.Session()
+
+# How long (in seconds) a found Apple TV URL is reused for the same lookup
+FOUND_URL_CACHE_TTL = 7 * 24 * 60 * 60
+# Maximum number of found URLs kept per lookup function
+FOUND_URL_CACHE_SIZE = 1024
+
+# URL templates for Apple TV content pages and the iTunes search API
+_CONTENT_URL_TEMPLATE = "https://tv.apple.com/us/{}/-/{}"
+_ITUNES_SEARCH_URL_TEMPLATE = (
+    "https://itunes.apple.com/search?term={}&media={}&entity={}&limit=25"
+)
+
+
+def _cache_found_urls(
+    func: Callable[..., str | None],
+) -> Callable[..., str | None]:
+    """Cache URLs found by a lookup function for `FOUND_URL_CACHE_TTL` seconds.
+
+    Lookups that found nothing are not cached, so they are retried on the
+    next call. At most `FOUND_URL_CACHE_SIZE` URLs are kept, evicting the
+    least recently used. Use `func.cache_clear()` to drop all cached URLs.
+    """
+    cache: OrderedDict[tuple, tuple[float, str]] = OrderedDict()
+    # Lookups run in worker threads, guard the cache (not the lookup itself)
+    lock = threading.Lock()
+
+    @wraps(func)
+    def wrapper(*args, **kwargs) -> str | None:
+        key = (args, tuple(sorted(kwargs.items())))
+        with lock:
+            cached = cache.get(key)
+            if cached:
+                if time.monotonic() - cached[0] < FOUND_URL_CACHE_TTL:
+                    cache.move_to_end(key)
+                    return cached[1]
+                del cache[key]
+        url = func(*args, **kwargs)
+        if url:
+            with lock:
+                cache[key] = (time.monotonic(), url)
+                cache.move_to_end(key)
+                while len(cache) > FOUND_URL_CACHE_SIZE:
+                    cache.popitem(last=False)
+        return url
+
+    def cache_clear() -> None:
+        with lock:
+            cache.clear()
+
+    wrapper.cache_clear = cache_clear  # type: ignore[attr-defined]
+    return wrapper
+
+
+def build_content_url(content_id: str, is_movie: bool = True) -> str:
+    """Build an Apple TV content URL from a content ID (umc.cmc.xxx)."""
+    media_type = "movie" if is_movie else "show"
+    return _CONTENT_URL_TEMPLATE.format(media_type, content_id)
+
+
+@lru_cache(maxsize=256)
+def _slug_pattern(slug: str) -> re.Pattern[str]:
+    """Compile the path segment pattern for a slug (cached per slug)."""
+    return re.compile(rf"/{re.escape(slug)}(?:[/?]|$)", re.IGNORECASE)
+
 
 def _slug_in_url(slug: str, url: str) -> bool:
     """Check if a slug appears as a complete path segment in a URL.
     
     This prevents false positives like "man" matching "superman" or "batman".
-    The slug must be surrounded by "/" characters to be a valid match.
+    The slug must be preceded by "/" and followed by "/", "?" or the end of
+    the URL to be a valid match.
     """
-    url_lower = url.lower()
-    # Check for slug as a path segment (surrounded by slashes or end of URL)
-    if f"/{slug}/" in url_lower:
-        return True
-    if url_lower.endswith(f"/{slug}"):
-        return True
-    return False
+    if not slug:
+        return False
+    return _slug_pattern(slug).search(url) is not None
 
 
+@lru_cache(maxsize=2048)
 def _title_to_slug(title: str) -> str:
     """Convert a title to a URL-friendly slug like Apple TV uses.
     
@@ -44,32 +146,41 @@ def _title_to_slug(title: str) -> str:
         "Spider-Man: No Way Home" -> "spider-man-no-way-home"
         "The Batman" -> "the-batman"
     """
-    # Normalize unicode characters
-    slug = normalize("NFKD", title).encode("ascii", "ignore").decode("ascii")
-    # Convert to lowercase
-    slug = slug.lower()
-    # Replace special chars with spaces (except hyphens)
-    slug = re.sub(r"[^\w\s-]", " ", slug)
-    # Replace whitespace with hyphens
-    slug = re.sub(r"[\s_]+", "-", slug)
+    # Normalize unicode characters, ASCII titles are already normalized
+    slug = title
+    if not slug.isascii():
+        slug = normalize("NFKD", slug).encode("ascii", "ignore").decode("ascii")
+    # Convert to lowercase, replace special chars and whitespace with hyphens
+    slug = slug.translate(_SLUG_TRANSLATION)
     # Remove duplicate hyphens
-    slug = re.sub(r"-+", "-", slug)
+    slug = _SLUG_HYPHENS_RE.sub("-", slug)
     # Strip leading/trailing hyphens
     slug = slug.strip("-")
     return slug
 
 
+@lru_cache(maxsize=2048)
 def _normalize_title(title: str) -> str:
     """Normalize a title for comparison."""
     title = title.lower()
     # Remove special characters and extra spaces
-    title = re.sub(r"[^\w\s]", "", title)
-    title = re.sub(r"\s+", " ", title).strip()
+    title = _NON_WORD_RE.sub("", title)
+    title = _WHITESPACE_RE.sub(" ", title).strip()
     return title
 
 
 def _titles_match(title1: str, title2: str, strict: bool = False) -> bool:
     """Check if two titles match (fuzzy comparison)."""
+    if title1 == title2:
+        return True
+
+    # Cheap checks before normalizing: containment of the lowercased titles
+    # implies containment of the normalized ones
+    lower1 = title1.lower()
+    lower2 = title2.lower()
+    if lower1 in lower2 or lower2 in lower1:
+        return True
+
     norm1 = _normalize_title(title1)
     norm2 = _normalize_title(title2)
 
@@ -98,21 +209,10 @@ def _titles_match(title1: str, title2: str, strict: bool = False) -> bool:
     return False
 
 
-def _calculate_match_score(
-    result_title: str,
-    search_title: str,
-    result_year: int,
-    search_year: int,
-    has_preview: bool = False,
-) -> int:
-    """Calculate a match score between search and result.
-    
-    Returns a score where higher is better. A score of 0 or negative means
-    the titles don't match at all.
-    """
+@lru_cache(maxsize=4096)
+def _title_match_score(norm_result: str, norm_search: str) -> int:
+    """Score how well two already normalized titles match."""
     score = 0
-    norm_result = _normalize_title(result_title)
-    norm_search = _normalize_title(search_title)
 
     # Exact match gets highest score
     if norm_result == norm_search:
@@ -139,6 +239,25 @@ def _calculate_match_score(
                 score += int(overlap_pct * 100)
             # else: score stays 0, meaning no title match
 
+    return score
+
+
+def _calculate_match_score(
+    result_title: str,
+    search_title: str,
+    result_year: int,
+    search_year: int,
+    has_preview: bool = False,
+) -> int:
+    """Calculate a match score between search and result.
+    
+    Returns a score where higher is better. A score of 0 or negative means
+    the titles don't match at all.
+    """
+    score = _title_match_score(
+        _normalize_title(result_title), _normalize_title(search_title)
+    )
+
     # Year match scoring - only add bonus, not as primary match
     if search_year > 0 and result_year > 0:
         year_diff = abs(search_year - result_year)
@@ -182,12 +301,12 @@ def search_apple_tv_api(
     }
 
     try:
-        response = requests.get(
+        response = _session.get(
             api_url, params=params, headers=HEADERS, timeout=30
         )
         if response.status_code != 200:
             # Try without SSL verification
-            response = requests.get(
+            response = _session.get(
                 api_url,
                 params=params,
                 headers=HEADERS,
@@ -197,7 +316,7 @@ def search_apple_tv_api(
         if response.status_code != 200:
             logger.debug(f"Apple TV API search returned {response.status_code}")
             return []
-        data = response.json()
+        data = json.loads(response.content)
     except Exception as e:
         logger.debug(f"Apple TV API search failed: {e}")
         return []
@@ -275,17 +394,14 @@ def search_apple_itunes(
     media_type = "movie" if is_movie else "tvShow"
     search_term = quote_plus(title)
 
-    url = (
-        f"https://itunes.apple.com/search?"
-        f"term={search_term}&media={media_type}&entity={media_type}&limit=25"
-    )
+    url = _ITUNES_SEARCH_URL_TEMPLATE.format(search_term, media_type, media_type)
 
     try:
-        response = requests.get(url, timeout=30)
+        response = _session.get(url, timeout=30)
         if response.status_code != 200:
-            response = requests.get(url, timeout=30, verify=False)
+            response = _session.get(url, timeout=30, verify=False)
         response.raise_for_status()
-        data = response.json()
+        data = json.loads(response.content)
     except Exception as e:
         logger.debug(f"iTunes search failed: {e}")
         return []
@@ -305,7 +421,8 @@ def search_apple_itunes(
         release_date = result.get("releaseDate", "")
         result_year = 0
 
-        if release_date:
+        # Result year only affects the score when a search year is given
+        if year and release_date:
             try:
                 result_year = int(release_date[:4])
             except (ValueError, TypeError):
@@ -323,10 +440,12 @@ def search_apple_itunes(
         if score >= MINIMUM_TITLE_MATCH_SCORE:
             scored_results.append((score, result))
 
-    scored_results.sort(key=lambda x: x[0], reverse=True)
+    # Return every match, the caller tries them in order until one validates
+    scored_results.sort(key=itemgetter(0), reverse=True)
     return [r[1] for r in scored_results]
 
 
+@_cache_found_urls
 def lookup_by_imdb_id(imdb_id: str, is_movie: bool = True) -> str | None:
     """Try to find Apple TV content URL using IMDB ID.
     
@@ -341,10 +460,10 @@ def lookup_by_imdb_id(imdb_id: str, is_movie: bool = True) -> str | None:
     search_url = f"https://tv.apple.com/us/search?term={imdb_id}"
     
     try:
-        response = requests.get(search_url, headers=HEADERS, timeout=30)
+        response = _session.get(search_url, headers=HEADERS, timeout=30)
         if response.status_code != 200:
             logger.warning("SSL verification failed, retrying without verification")
-            response = requests.get(
+            response = _session.get(
                 search_url, headers=HEADERS, timeout=30, verify=False
             )
         
@@ -416,9 +535,9 @@ def search_apple_tv_web(
     search_url = f"https://tv.apple.com/us/search?term={search_term}"
 
     try:
-        response = requests.get(search_url, headers=HEADERS, timeout=30)
+        response = _session.get(search_url, headers=HEADERS, timeout=30)
         if response.status_code != 200:
-            response = requests.get(
+            response = _session.get(
                 search_url, headers=HEADERS, timeout=30, verify=False
             )
         if response.status_code != 200:
@@ -502,8 +621,7 @@ def _extract_content_url_from_search(
                     if score >= MINIMUM_TITLE_MATCH_SCORE:
                         url = item_url
                         if not url and item_id:
-                            media = "movie" if is_movie else "show"
-                            url = f"https://tv.apple.com/us/{media}/-/{item_id}"
+                            url = build_content_url(item_id, is_movie)
                         if url:
                             candidates.append((score, url))
 
@@ -516,8 +634,8 @@ def _extract_content_url_from_search(
     search_recursive(data)
 
     if candidates:
-        candidates.sort(key=lambda x: x[0], reverse=True)
-        return candidates[0][1]
+        # max() keeps the first of equally scored candidates, like a stable sort
+        return max(candidates, key=itemgetter(0))[1]
     return None
 
 
@@ -548,11 +666,11 @@ def try_direct_slug_url(
     logger.debug(f"Trying direct slug URL: {direct_url}")
     
     try:
-        response = requests.get(
+        response = _session.get(
             direct_url, headers=HEADERS, timeout=30, allow_redirects=True
         )
         if response.status_code != 200:
-            response = requests.get(
+            response = _session.get(
                 direct_url,
                 headers=HEADERS,
                 timeout=30,
@@ -566,8 +684,7 @@ def try_direct_slug_url(
             if f"/{media_type}/" in final_url and "umc." in final_url:
                 logger.debug(f"Redirected to: {final_url}")
                 # Try to get trailer from this URL
-                atvp = AppleTVPlus()
-                trailers = atvp.get_trailers(final_url, default_only=True)
+                trailers = get_trailers(final_url, default_only=True)
                 if trailers:
                     trailer = trailers[0]
                     score = _calculate_match_score(
@@ -592,8 +709,7 @@ def try_direct_slug_url(
                     found_url = _find_content_url_in_data(data, slug, media_type)
                     if found_url:
                         logger.debug(f"Found content URL in page data: {found_url}")
-                        atvp = AppleTVPlus()
-                        trailers = atvp.get_trailers(found_url, default_only=True)
+                        trailers = get_trailers(found_url, default_only=True)
                         if trailers:
                             trailer = trailers[0]
                             score = _calculate_match_score(
@@ -615,9 +731,9 @@ def try_direct_slug_url(
     search_url = f"https://tv.apple.com/us/search?term={encoded_term}"
     
     try:
-        response = requests.get(search_url, headers=HEADERS, timeout=30)
+        response = _session.get(search_url, headers=HEADERS, timeout=30)
         if response.status_code != 200:
-            response = requests.get(
+            response = _session.get(
                 search_url, headers=HEADERS, timeout=30, verify=False
             )
         if response.status_code != 200:
@@ -637,8 +753,7 @@ def try_direct_slug_url(
                 logger.debug(f"Found matching slug URL: {href}")
                 
                 # Verify this URL has the content we want
-                atvp = AppleTVPlus()
-                trailers = atvp.get_trailers(href, default_only=True)
+                trailers = get_trailers(href, default_only=True)
                 if trailers:
                     trailer = trailers[0]
                     # Verify title match
@@ -662,8 +777,7 @@ def try_direct_slug_url(
                 # Recursively search for content matching our slug
                 found_url = _find_url_by_slug_in_data(data, slug, media_type, title)
                 if found_url:
-                    atvp = AppleTVPlus()
-                    trailers = atvp.get_trailers(found_url, default_only=True)
+                    trailers = get_trailers(found_url, default_only=True)
                     if trailers:
                         trailer = trailers[0]
                         score = _calculate_match_score(
@@ -683,26 +797,40 @@ def try_direct_slug_url(
 def _find_content_url_in_data(
     data: Any, slug: str, media_type: str
 ) -> str | None:
-    """Find a content URL containing the slug in serialized page data."""
-    if isinstance(data, dict):
-        for key in ["url", "canonicalUrl", "href", "link"]:
-            url_val = data.get(key, "")
-            if url_val and isinstance(url_val, str):
-                if f"/{media_type}/" in url_val and _slug_in_url(slug, url_val):
-                    if "umc." in url_val:  # Has content ID
-                        if not url_val.startswith("http"):
-                            url_val = f"https://tv.apple.com{url_val}"
-                        return url_val
-        
-        for v in data.values():
-            result = _find_content_url_in_data(v, slug, media_type)
-            if result:
-                return result
-    elif isinstance(data, list):
-        for item in data:
-            result = _find_content_url_in_data(item, slug, media_type)
-            if result:
-                return result
+    """Find a content URL containing the slug in serialized page data.
+
+    Walks the data depth-first with an explicit stack (same order as a
+    recursive walk) and stops at the first matching URL.
+    """
+    media_segment = f"/{media_type}/"
+    stack = [data]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, dict):
+            for key in ("url", "canonicalUrl", "href", "link"):
+                url_val = node.get(key)
+                # Cheap substring checks first, the slug regex only runs for
+                # URLs that have a content ID and the right media type
+                if (
+                    isinstance(url_val, str)
+                    and "umc." in url_val
+                    and media_segment in url_val
+                    and _slug_in_url(slug, url_val)
+                ):
+                    if not url_val.startswith("http"):
+                        url_val = f"https://tv.apple.com{url_val}"
+                    return url_val
+            children = node.values()
+        elif isinstance(node, list):
+            children = node
+        else:
+            continue
+        # Push in reverse so children are visited in their original order
+        stack.extend(
+            child
+            for child in reversed(list(children))
+            if isinstance(child, (dict, list))
+        )
     return None
 
 
@@ -749,7 +877,7 @@ def _extract_url_from_ddg_redirect(href: str) -> str:
     in a 'uddg' query parameter.
     """
     if "uddg=" in href:
-        match = re.search(r"uddg=([^&]+)", href)
+        match = _DDG_REDIRECT_URL_RE.search(href)
         if match:
             return unquote(match.group(1))
     return href
@@ -779,6 +907,24 @@ def _is_valid_apple_tv_url(
         return False
 
 
+def _parse_ddg_anchors(html_text: str) -> list[tuple[list[str], str, str]]:
+    """Get the classes, href and text of each link in a DuckDuckGo page."""
+    anchors = []
+    for match in _HTML_ANCHOR_RE.finditer(html_text):
+        attrs, inner = match.groups()
+        class_match = _HTML_CLASS_RE.search(attrs)
+        href_match = _HTML_HREF_RE.search(attrs)
+        anchors.append(
+            (
+                class_match.group(1).split() if class_match else [],
+                unescape(href_match.group(1)) if href_match else "",
+                unescape(_HTML_TAG_RE.sub("", inner)).strip(),
+            )
+        )
+    return anchors
+
+
+@_cache_found_urls
 def search_web_for_apple_tv_url(
     title: str, year: int = 0, is_movie: bool = True
 ) -> str | None:
@@ -815,7 +961,7 @@ def search_web_for_apple_tv_url(
     }
 
     try:
-        response = requests.get(
+        response = _session.get(
             search_url,
             headers=search_headers,
             timeout=30,
@@ -825,30 +971,31 @@ def search_web_for_apple_tv_url(
             logger.debug(f"Web search returned status {response.status_code}")
             return None
 
-        soup = BeautifulSoup(response.text, "html.parser")
+        anchors = _parse_ddg_anchors(response.text)
         slug = _title_to_slug(title)
 
         # Look for result links containing Apple TV URLs
-        for link in soup.find_all("a", class_="result__a"):
-            href = _extract_url_from_ddg_redirect(link.get("href", ""))
-            if _is_valid_apple_tv_url(href, media_type, slug):
-                logger.debug(f"Found Apple TV URL via web search: {href}")
-                return href
+        for classes, href, _ in anchors:
+            if "result__a" in classes:
+                href = _extract_url_from_ddg_redirect(href)
+                if _is_valid_apple_tv_url(href, media_type, slug):
+                    logger.debug(f"Found Apple TV URL via web search: {href}")
+                    return href
 
         # Also check result URL display text
-        for link in soup.find_all("a", class_="result__url"):
-            text = link.get_text().strip()
-            # Ensure we have a proper URL format
-            if not text.startswith("http"):
-                text = f"https://{text}"
-            # Use the same validated URL check
-            if _is_valid_apple_tv_url(text, media_type, slug):
-                logger.debug(f"Found Apple TV URL via web search: {text}")
-                return text
+        for classes, _, text in anchors:
+            if "result__url" in classes:
+                # Ensure we have a proper URL format
+                if not text.startswith("http"):
+                    text = f"https://{text}"
+                # Use the same validated URL check
+                if _is_valid_apple_tv_url(text, media_type, slug):
+                    logger.debug(f"Found Apple TV URL via web search: {text}")
+                    return text
 
         # Try alternative pattern: look for any links with Apple TV URLs
-        for link in soup.find_all("a", href=True):
-            href = _extract_url_from_ddg_redirect(link.get("href", ""))
+        for _, href, _ in anchors:
+            href = _extract_url_from_ddg_redirect(href)
             if _is_valid_apple_tv_url(href, media_type, slug):
                 logger.debug(f"Found Apple TV URL via web search: {href}")
                 return href
@@ -861,7 +1008,7 @@ def search_web_for_apple_tv_url(
 
 def search_for_trailer(
     media: MediaRead,
-    exclude: list[str] | None = None,
+    exclude: Collection[str] | None = None,
 ) -> TrailerInfo | None:
     """Search for a trailer for the given media item.
 
@@ -878,8 +1025,7 @@ def search_for_trailer(
     """
     logger.info(f"Searching Apple TV for trailer for '{media.title}'...")
 
-    if not exclude:
-        exclude = []
+    exclude = frozenset(exclude or ())
 
     # Strategy 0: Try IMDB ID lookup first (most reliable when available)
     if media.imdb_id:
@@ -906,8 +1052,7 @@ def search_for_trailer(
     for result in api_results:
         content_url = result.get("url")
         if not content_url and result.get("id"):
-            media_type = "movie" if media.is_movie else "show"
-            content_url = f"https://tv.apple.com/us/{media_type}/-/{result['id']}"
+            content_url = build_content_url(result["id"], media.is_movie)
         
         if content_url:
             trailer = _fetch_and_validate_trailer(
@@ -933,20 +1078,11 @@ def search_for_trailer(
 
         # Try to extract Apple TV URL from iTunes URL
         content_url = None
-        if track_url:
-            try:
-                parsed = urlparse(track_url)
-                if parsed.netloc.endswith(".apple.com") or parsed.netloc == "apple.com":
-                    if "/movie/" in track_url or "/tv-season/" in track_url:
-                        content_url = track_url.replace(
-                            "itunes.apple.com", "tv.apple.com"
-                        )
-            except Exception:
-                pass
+        if track_url and _ITUNES_CONTENT_URL_RE.match(track_url):
+            content_url = track_url.replace("itunes.apple.com", "tv.apple.com")
 
         if not content_url and track_id:
-            media_type = "movie" if media.is_movie else "show"
-            content_url = f"https://tv.apple.com/us/{media_type}/-/{track_id}"
+            content_url = build_content_url(track_id, media.is_movie)
 
         if content_url:
             trailer = _fetch_and_validate_trailer(
@@ -975,7 +1111,7 @@ def _fetch_and_validate_trailer(
     content_url: str,
     search_title: str,
     search_year: int,
-    exclude: list[str],
+    exclude: frozenset[str],
 ) -> TrailerInfo | None:
     """Fetch trailer from URL and validate it matches the search title.
     
@@ -984,20 +1120,18 @@ def _fetch_and_validate_trailer(
     logger.debug(f"Attempting to fetch trailer from: {content_url}")
 
     try:
-        atvp = AppleTVPlus()
-        trailers = atvp.get_trailers(content_url, default_only=True)
+        trailers = get_trailers(content_url, default_only=True)
 
         if not trailers:
             logger.debug(f"No trailers returned from URL: {content_url}")
             return None
 
+        norm_search = _normalize_title(search_title)
         for trailer in trailers:
             # Validate that the content title matches our search
-            content_score = _calculate_match_score(
-                trailer.content_title,
-                search_title,
-                0,  # Don't use year for title check
-                0,
+            # Year is not used for the title check
+            content_score = _title_match_score(
+                _normalize_title(trailer.content_title), norm_search
             )
             
             if content_score < MINIMUM_TITLE_MATCH_SCORE:
@@ -1026,8 +1160,7 @@ def _fetch_and_validate_trailer(
 def get_trailer_by_url(url: str) -> TrailerInfo | None:
     """Get trailer information directly from an Apple TV URL."""
     try:
-        atvp = AppleTVPlus()
-        trailers = atvp.get_trailers(url, default_only=True)
+        trailers = get_trailers(url, default_only=True)
         return trailers[0] if trailers else None
     except Exception as e:
         logger.error(f"Failed to get trailer from URL: {e}")
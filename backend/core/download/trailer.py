@@ -1,6 +1,8 @@
 """Trailer download module using Apple TV as the source."""
 
+import asyncio
 from datetime import datetime, timezone
+from functools import cache
 import os
 
 import requests
@@ -12,13 +14,24 @@ from core.base.database.models.media import MediaRead, MonitorStatus
 from core.base.database.models.trailerprofile import TrailerProfileRead
 from core.download.trailers.service import record_new_trailer_download
 from core.download.apple.downloader import download_apple_trailer
-from core.download.apple.api import TrailerInfo, AppleTVPlus
+from core.download.apple.api import TrailerInfo, get_trailers
+from core.download.apple.search import build_content_url
 from core.download import trailer_file, trailer_search, video_analysis
 from exceptions import DownloadFailedError
 
 logger = ModuleLogger("TrailersDownloader")
 
 
+@cache
+def _get_tmp_dir() -> str:
+    """Resolve the temporary download directory once per process."""
+    for tmp_dir in ("/var/lib/trailarr/tmp", "/app/tmp"):
+        if os.path.isdir(tmp_dir):
+            return tmp_dir
+    os.makedirs("/app/tmp", exist_ok=True)
+    return "/app/tmp"
+
+
 def _get_trailer_from_manual_id(
     apple_id: str, media_title: str, is_movie: bool = True
 ) -> TrailerInfo | None:
@@ -40,8 +53,7 @@ def _get_trailer_from_manual_id(
 
     # Construct URL if only ID is provided
     if apple_id.startswith("umc."):
-        media_type = "movie" if is_movie else "show"
-        content_url = f"https://tv.apple.com/us/{media_type}/-/{apple_id}"
+        content_url = build_content_url(apple_id, is_movie)
     elif apple_id.startswith("http"):
         content_url = apple_id
     else:
@@ -53,8 +65,7 @@ def _get_trailer_from_manual_id(
     )
 
     try:
-        atvp = AppleTVPlus()
-        trailers = atvp.get_trailers(content_url, default_only=True)
+        trailers = get_trailers(content_url, default_only=True)
         if trailers:
             logger.info(f"Found trailer: {trailers[0].video_title}")
             return trailers[0]
@@ -123,13 +134,7 @@ async def __download_and_verify_trailer(
         f"Downloading trailer for '{media.title}' [{media.id}] "
         f"from Apple TV: {trailer_info.video_title}"
     )
-    tmp_dir = "/var/lib/trailarr/tmp"
-    if not os.path.exists(tmp_dir):
-        tmp_dir = "/app/tmp"
-    if not os.path.exists(tmp_dir):
-        os.makedirs(tmp_dir, exist_ok=True)
-
-    output_file = f"{tmp_dir}/{media.id}-trailer.{profile.file_format}"
+    output_file = f"{_get_tmp_dir()}/{media.id}-trailer.{profile.file_format}"
 
     output_file = await download_apple_trailer(
         trailer_info, output_file, profile
@@ -162,10 +167,9 @@ async def download_trailer(
         DownloadFailedError: If trailer download fails.
     """
     logger.info(f"Downloading trailer for '{media.title}' [{media.id}]")
-    if not exclude:
-        exclude = []
+    exclude_ids = set(exclude or ())
 
-    trailer_info = None
+    manual_trailer_info = None
     manual_id_provided = False
 
     # Strategy 1: If a manual Apple TV ID/URL was provided, use it directly
@@ -177,75 +181,78 @@ async def download_trailer(
         apple_id = media.youtube_trailer_id
         if apple_id.startswith("umc.") or apple_id.startswith("http"):
             manual_id_provided = True
-            trailer_info = _get_trailer_from_manual_id(
-                apple_id, media.title, media.is_movie
+            manual_trailer_info = await asyncio.to_thread(
+                _get_trailer_from_manual_id,
+                apple_id,
+                media.title,
+                media.is_movie,
             )
 
-    # Strategy 2: Search for trailer on Apple TV if no manual ID or it failed
-    if not trailer_info:
-        # Only exclude the current trailer ID for re-downloads (not for manual IDs)
-        if media.trailer_exists and media.youtube_trailer_id and not manual_id_provided:
-            exclude.append(media.youtube_trailer_id)
-
-        trailer_info = trailer_search.get_trailer_info(media, profile, exclude)
-
-    if not trailer_info:
-        error_msg = (
-            f"No trailer found for '{media.title}'. "
-            "Try providing the Apple TV URL manually (e.g., "
-            "https://tv.apple.com/us/movie/movie-name/umc.cmc.xxx)"
-        )
-        raise DownloadFailedError(error_msg)
-
-    apple_id = trailer_info.apple_id or ""
+    # Only exclude the current trailer ID for re-downloads (not for manual IDs)
+    if media.trailer_exists and media.youtube_trailer_id and not manual_id_provided:
+        exclude_ids.add(media.youtube_trailer_id)
 
-    try:
-        __update_media_status(
-            media, MonitorStatus.DOWNLOADING, profile, apple_id
+    for attempt in range(retry_count + 1):
+        # Strategy 2: Search for trailer on Apple TV if no manual ID or it failed
+        # Search uses blocking HTTP requests, run it off the event loop
+        trailer_info = manual_trailer_info or await asyncio.to_thread(
+            trailer_search.get_trailer_info, media, profile, exclude_ids
         )
 
-        # Download the trailer and verify
-        output_file = await __download_and_verify_trailer(
-            media, trailer_info, profile
-        )
+        if not trailer_info:
+            error_msg = (
+                f"No trailer found for '{media.title}'. "
+                "Try providing the Apple TV URL manually (e.g., "
+                "https://tv.apple.com/us/movie/movie-name/umc.cmc.xxx)"
+            )
+            raise DownloadFailedError(error_msg)
 
-        # Move the trailer to the media folder
-        final_path = trailer_file.move_trailer_to_folder(
-            output_file, media, profile
-        )
+        apple_id = trailer_info.apple_id or ""
 
-        __update_media_status(
-            media, MonitorStatus.DOWNLOADED, profile, apple_id
-        )
-
-        # Record the download in the database
-        await record_new_trailer_download(
-            media, profile.id, final_path, apple_id
-        )
+        try:
+            __update_media_status(
+                media, MonitorStatus.DOWNLOADING, profile, apple_id
+            )
 
-        msg = (
-            f"Trailer downloaded successfully for '{media.title}' [{media.id}]"
-            f" from Apple TV ({trailer_info.video_title})"
-        )
-        logger.info(msg)
-        await websockets.ws_manager.broadcast(msg, "Success", reload="media")
-        return True
+            # Download the trailer and verify
+            output_file = await __download_and_verify_trailer(
+                media, trailer_info, profile
+            )
 
-    except Exception as e:
-        logger.exception(f"Failed to download trailer: {e}")
-        __update_media_status(media, MonitorStatus.MISSING, profile, apple_id)
+            # Move the trailer to the media folder
+            final_path = trailer_file.move_trailer_to_folder(
+                output_file, media, profile
+            )
 
-        if retry_count > 0:
-            logger.info(
-                f"Retrying download for '{media.title}'... "
-                f"({3 - retry_count}/3)"
+            __update_media_status(
+                media, MonitorStatus.DOWNLOADED, profile, apple_id
             )
-            if apple_id:
-                exclude.append(apple_id)
-            return await download_trailer(
-                media, profile, retry_count - 1, exclude
+
+            # Record the download in the database
+            await record_new_trailer_download(
+                media, profile.id, final_path, apple_id
             )
 
-        raise DownloadFailedError(
-            f"Failed to download trailer for '{media.title}'"
-        )
+            msg = (
+                f"Trailer downloaded successfully for '{media.title}' [{media.id}]"
+                f" from Apple TV ({trailer_info.video_title})"
+            )
+            logger.info(msg)
+            await websockets.ws_manager.broadcast(msg, "Success", reload="media")
+            return True
+
+        except Exception as e:
+            logger.exception(f"Failed to download trailer: {e}")
+            __update_media_status(media, MonitorStatus.MISSING, profile, apple_id)
+
+            if attempt < retry_count:
+                logger.info(
+                    f"Retrying download for '{media.title}'... "
+                    f"({attempt + 1}/{retry_count})"
+                )
+                if apple_id:
+                    exclude_ids.add(apple_id)
+
+    raise DownloadFailedError(
+        f"Failed to download trailer for '{media.title}'"
+    )
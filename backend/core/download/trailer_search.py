@@ -1,5 +1,7 @@
 """Trailer search module using Apple TV as the source."""
 
+from typing import Collection
+
 from app_logger import ModuleLogger
 from core.base.database.models.media import MediaRead
 from core.base.database.models.trailerprofile import TrailerProfileRead
@@ -20,7 +22,7 @@ def search_for_trailer(
     Returns:
         str | None: Apple TV trailer ID if found, else None.
     """
-    trailer_info = apple_search(media, exclude=[])
+    trailer_info = apple_search(media)
     if not trailer_info:
         return None
     return trailer_info.apple_id
@@ -29,21 +31,18 @@ def search_for_trailer(
 def get_trailer_info(
     media: MediaRead,
     profile: TrailerProfileRead,
-    exclude: list[str] | None = None,
+    exclude: Collection[str] | None = None,
 ) -> TrailerInfo | None:
     """Get trailer information for the media object from Apple TV. \n
     Args:
         media (MediaRead): Media object.
         profile (TrailerProfileRead): The trailer profile to use.
-        exclude (list[str], Optional=None): List of Apple IDs to exclude.
+        exclude (Collection[str], Optional=None): Apple IDs to exclude.
     Returns:
         TrailerInfo | None: Trailer info object / None if not found.
     """
-    if not exclude:
-        exclude = []
-
-    # Search for trailer on Apple TV
-    trailer_info = apple_search(media, exclude)
+    # Search for trailer on Apple TV, excluded IDs are filtered by the search
+    trailer_info = apple_search(media, frozenset(exclude or ()))
 
     if not trailer_info:
         filter_name = (
@@ -57,13 +56,6 @@ def get_trailer_info(
         )
         return None
 
-    # Check if trailer is in exclude list
-    if trailer_info.apple_id and trailer_info.apple_id in exclude:
-        logger.debug(
-            f"Trailer {trailer_info.apple_id} is in exclude list"
-        )
-        return None
-
     logger.info(
         f"Found trailer for '{media.title}': {trailer_info.video_title}"
     )
@@ -1,9 +1,21 @@
 import asyncio
 from random import randint
 import re
+import string
 
 from app_logger import ModuleLogger
 
+_YOUTUBE_ID_RE = re.compile(
+    r"^.*(youtu.be\/|v\/|u\/\w\/|embed\/|watch\?v=|\&v=)([^#\&\?]*)"
+)
+# Common URL shapes that end with a bare video id, checked before the regex
+_YOUTUBE_ID_PREFIXES = (
+    "https://youtu.be/",
+    "https://www.youtube.com/watch?v=",
+    "https://youtube.com/watch?v=",
+)
+_YOUTUBE_ID_CHARS = string.ascii_letters + string.digits + "-_"
+
 
 def extract_youtube_id(url: str) -> str | None:
     """Extract youtube video id from url. \n
@@ -11,10 +23,13 @@ def extract_youtube_id(url: str) -> str | None:
         url (str): URL of the youtube video. \n
     Returns:
         str|None: Youtube video id / None if invalid URL."""
-    regex = re.compile(
-        r"^.*(youtu.be\/|v\/|u\/\w\/|embed\/|watch\?v=|\&v=)([^#\&\?]*).*"
-    )
-    match = regex.match(url)
+    for prefix in _YOUTUBE_ID_PREFIXES:
+        if url.startswith(prefix):
+            video_id = url[len(prefix) :]
+            if len(video_id) == 11 and not video_id.strip(_YOUTUBE_ID_CHARS):
+                return video_id
+            break
+    match = _YOUTUBE_ID_RE.match(url)
     if match and len(match.group(2)) == 11:
         return match.group(2)
     else:
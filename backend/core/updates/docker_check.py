@@ -1,3 +1,7 @@
+import re
+import time
+from functools import cache
+
 import aiohttp
 
 from app_logger import ModuleLogger
@@ -5,9 +9,26 @@ from config.settings import app_settings
 
 logger = ModuleLogger("UpdateChecker")
 
+# How long (in seconds) a fetched release tag is reused without asking Github
+LATEST_VERSION_CACHE_TTL = 15 * 60
+
+# ETag and release tag of the last Github API response, keyed by image name
+_release_etags: dict[str, tuple[str, str]] = {}
+# Fetch time (monotonic) and release tag, keyed by image name
+_latest_versions: dict[str, tuple[float, str]] = {}
+
+
+def invalidate_latest_image_version() -> None:
+    """Clear the cached latest release tags, next check will query Github."""
+    _latest_versions.clear()
+
 
 async def get_latest_image_version(image_name: str) -> str | None:
     """Gets the latest release tag from Github API asynchronously.
+    Tags fetched within the last `LATEST_VERSION_CACHE_TTL` seconds are \
+        returned without making a request.
+    Sends the ETag of the previous response, so an unchanged release is \
+        answered with a `304 Not Modified` and the cached tag is reused.
     Args:
         image_name (str): The name of the Docker image on Docker Hub. \n
             Example: "library/ubuntu" \n
@@ -15,18 +36,74 @@ async def get_latest_image_version(image_name: str) -> str | None:
         str|None: The latest release tag of the image.\n
             Example: "v0.2.0"
     """
+    cached_version = _latest_versions.get(image_name)
+    if cached_version:
+        fetched_at, latest_version = cached_version
+        if time.monotonic() - fetched_at < LATEST_VERSION_CACHE_TTL:
+            return latest_version
+
     url = f"https://api.github.com/repos/{image_name}/releases/latest"
+    headers = {"Accept": "application/vnd.github+json"}
+    cached_release = _release_etags.get(image_name)
+    if cached_release:
+        headers["If-None-Match"] = cached_release[0]
     try:
         async with aiohttp.ClientSession() as session:
-            async with session.get(url) as response:
-                response.raise_for_status()
-                release_data = await response.json()
-                return release_data["tag_name"]
+            async with session.get(url, headers=headers) as response:
+                if cached_release and response.status == 304:
+                    latest_version = cached_release[1]
+                else:
+                    response.raise_for_status()
+                    release_data = await response.json()
+                    latest_version = release_data["tag_name"]
+                    if etag := response.headers.get("ETag"):
+                        _release_etags[image_name] = (etag, latest_version)
+                _latest_versions[image_name] = (time.monotonic(), latest_version)
+                return latest_version
     except Exception as e:
         logger.error(f"Error fetching release info from Github API: {e}")
         return None
 
 
+_VERSION_NUMBERS_RE = re.compile(r"v?(\d+(?:\.\d+)*)")
+
+# Default version when APP_VERSION is not set (see config.settings)
+_DEFAULT_VERSION = "0.0.0"
+# Nightly builds are versioned by build date, like '251015-nightly'
+_NIGHTLY_SUFFIX = "-nightly"
+
+
+@cache
+def _parse_version(version: str) -> tuple[int, ...] | None:
+    """Parse the numeric part of a version like 'v1.2.3' into a tuple of ints.
+    Returns None if the version does not start with a number."""
+    match = _VERSION_NUMBERS_RE.match(version.strip())
+    if not match:
+        return None
+    return tuple(int(part) for part in match.group(1).split("."))
+
+
+def _is_newer_version(latest_version: str, current_version: str) -> bool:
+    """Check if the latest version is newer than the current version. \n
+    Versions are compared numerically, ignoring a leading 'v'. If the numbers \
+        are equal or can't be parsed, any other difference (like a '-dev' \
+        suffix on the current version) counts as newer. \n
+    Nightly and unversioned builds have no release number to compare, so \
+        any latest release that differs from them counts as newer.
+    """
+    if (
+        current_version.endswith(_NIGHTLY_SUFFIX)
+        or current_version == _DEFAULT_VERSION
+    ):
+        return latest_version != current_version
+    latest = _parse_version(latest_version)
+    current = _parse_version(current_version)
+    if latest is None or current is None or latest == current:
+        latest_version = latest_version.strip().lstrip("v")
+        return latest_version != current_version.strip().lstrip("v")
+    return latest > current
+
+
 def get_current_image_version() -> str:
     """Gets the current version of the app running in the container."""
     return app_settings.version
@@ -45,7 +122,7 @@ async def check_for_update() -> None:
     if not latest_version:
         return
 
-    if current_version != latest_version:
+    if _is_newer_version(latest_version, current_version):
         logger.info(
             f"A newer version ({latest_version}) of Trailarr is available."
             " Please update!"
@@ -57,9 +134,8 @@ async def check_for_update() -> None:
         )
 
 
-async def check_for_updates():
-    """Check for updates to the Docker image."""
-    await check_for_update()
+# Alias used by the scheduler
+check_for_updates = check_for_update
 
 
 # if __name__ == "__main__":
@@ -1,6 +1,10 @@
 """Tests for Apple TV API module."""
 
+from unittest.mock import MagicMock
+
 import pytest
+import requests
+from core.download.apple import api
 from core.download.apple.api import TrailerInfo
 
 
@@ -65,3 +69,132 @@ class TestTrailerInfo:
         assert result["release_date"] == "2024-01-15"
         assert result["genres"] == ["Action"]
         assert result["apple_id"] == "test123"
+
+
+def _token_page(token: str) -> MagicMock:
+    """Create an Apple TV page response that contains the given token."""
+    response = MagicMock()
+    response.status_code = 200
+    response.text = f'<script>{{"developerToken": "{token}"}}</script>'
+    return response
+
+
+@pytest.fixture
+def no_shared_client(monkeypatch):
+    """Start without a shared client and without fetching trailers."""
+    monkeypatch.setattr(api, "_shared_client", None)
+    monkeypatch.setattr(
+        api.AppleTVPlus, "get_trailers", MagicMock(return_value=[])
+    )
+
+
+class TestGetTrailers:
+    """Tests for the shared client get_trailers function."""
+
+    def test_reuses_shared_client(self, monkeypatch):
+        """Test that the AppleTVPlus client is only created once."""
+        mock_cls = MagicMock()
+        mock_cls.return_value.get_trailers.return_value = []
+        mock_cls.return_value.needs_new_token.return_value = False
+        monkeypatch.setattr(api, "AppleTVPlus", mock_cls)
+        monkeypatch.setattr(api, "_shared_client", None)
+
+        api.get_trailers("https://tv.apple.com/us/movie/a/umc.cmc.1")
+        api.get_trailers("https://tv.apple.com/us/movie/b/umc.cmc.2", True)
+
+        mock_cls.assert_called_once()
+        mock_cls.return_value.get_trailers.assert_called_with(
+            "https://tv.apple.com/us/movie/b/umc.cmc.2", default_only=True
+        )
+
+    def test_lookup_runs_without_lock(self, monkeypatch):
+        """Test that the lock is not held while a lookup does network I/O."""
+        lock_held = []
+
+        def get_trailers(url, default_only=False):
+            lock_held.append(api._shared_client_lock.locked())
+            return []
+
+        mock_cls = MagicMock()
+        mock_cls.return_value.get_trailers.side_effect = get_trailers
+        monkeypatch.setattr(api, "AppleTVPlus", mock_cls)
+        monkeypatch.setattr(api, "_shared_client", None)
+
+        api.get_trailers("https://tv.apple.com/us/movie/a/umc.cmc.1")
+
+        assert lock_held == [False]
+
+    def test_refetches_token_after_fallback(self, monkeypatch, no_shared_client):
+        """Test that a client that fell back gets a fresh token later."""
+        mock_get = MagicMock(
+            side_effect=requests.exceptions.ConnectionError("down")
+        )
+        monkeypatch.setattr(api.requests, "get", mock_get)
+
+        api.get_trailers("https://tv.apple.com/us/movie/a/umc.cmc.1")
+        client = api._shared_client
+        assert client is not None
+        assert "authorization" not in client.session.headers
+        assert client.needs_new_token()
+
+        mock_get.side_effect = None
+        mock_get.return_value = _token_page("fresh-token")
+        api.get_trailers("https://tv.apple.com/us/movie/a/umc.cmc.1")
+
+        assert api._shared_client is client
+        assert client.session.headers["authorization"] == "Bearer fresh-token"
+        assert not client.needs_new_token()
+
+    def test_refreshes_expired_token(self, monkeypatch, no_shared_client):
+        """Test that a token older than the max age is fetched again."""
+        mock_get = MagicMock(return_value=_token_page("old-token"))
+        monkeypatch.setattr(api.requests, "get", mock_get)
+        api.get_trailers("https://tv.apple.com/us/movie/a/umc.cmc.1")
+        client = api._shared_client
+        assert client.session.headers["authorization"] == "Bearer old-token"
+
+        expired_at = client._token_fetched_at + api.ACCESS_TOKEN_MAX_AGE + 1
+        monkeypatch.setattr(api.time, "monotonic", lambda: expired_at)
+        mock_get.return_value = _token_page("new-token")
+        api.get_trailers("https://tv.apple.com/us/movie/a/umc.cmc.1")
+
+        assert client.session.headers["authorization"] == "Bearer new-token"
+
+
+class TestParseUrl:
+    """Tests for AppleTVPlus._parse_url."""
+
+    @pytest.mark.parametrize(
+        "url,kind,content_id",
+        [
+            ("https://tv.apple.com/us/movie/dune/umc.cmc.1", "movie", "umc.cmc.1"),
+            ("tv.apple.com/us/show/severance/umc.cmc.2", "show", "umc.cmc.2"),
+            (
+                "https://tv.apple.com/us/episode/e/umc.cmc.3?showId=umc.cmc.4",
+                "show",
+                "umc.cmc.4",
+            ),
+            (
+                "https://tv.apple.com/us/clip/c/umc.cmc.5"
+                "?targetId=umc.cmc.6&targetType=Movie",
+                "movie",
+                "umc.cmc.6",
+            ),
+        ],
+    )
+    def test_parse_url(self, monkeypatch, url, kind, content_id):
+        """Test that URLs are parsed into a per-lookup content reference."""
+        monkeypatch.setattr(api.AppleTVPlus, "_get_access_token", MagicMock())
+        client = api.AppleTVPlus()
+
+        ref = client._parse_url(url)
+
+        assert ref is not None
+        assert (ref.kind, ref.id) == (kind, content_id)
+
+    def test_parse_invalid_url(self, monkeypatch):
+        """Test that URLs on other hosts are rejected."""
+        monkeypatch.setattr(api.AppleTVPlus, "_get_access_token", MagicMock())
+        client = api.AppleTVPlus()
+
+        assert client._parse_url("https://example.com/us/movie/a/b") is None
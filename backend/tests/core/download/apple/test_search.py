@@ -1,6 +1,12 @@
 """Tests for Apple trailer search module."""
 
+import json
+from unittest.mock import MagicMock
+
 import pytest
+from core.base.database.models.media import MediaRead
+from core.download.apple import search
+from core.download.apple.api import TrailerInfo
 from core.download.apple.search import (
     _normalize_title,
     _titles_match,
@@ -10,9 +16,18 @@ from core.download.apple.search import (
     lookup_by_imdb_id,
     _find_content_url_in_data,
     search_web_for_apple_tv_url,
+    _ITUNES_CONTENT_URL_RE,
+    FOUND_URL_CACHE_TTL,
 )
 
 
+@pytest.fixture(autouse=True)
+def clear_found_url_cache():
+    """Start every test without any cached lookup results."""
+    lookup_by_imdb_id.cache_clear()
+    search_web_for_apple_tv_url.cache_clear()
+
+
 class TestSlugInUrl:
     """Tests for _slug_in_url function."""
 
@@ -26,6 +41,8 @@ class TestSlugInUrl:
             ("the-batman", "/us/movie/the-batman/", True),
             # End of URL (no trailing slash)
             ("test-movie", "/us/movie/test-movie", True),
+            # Followed by a query string
+            ("test-movie", "/us/movie/test-movie?ls=1", True),
             # False positives that should NOT match
             ("man", "/us/movie/superman/umc.123", False),  # "man" in "superman"
             ("man", "/us/movie/batman/umc.123", False),  # "man" in "batman"
@@ -34,6 +51,7 @@ class TestSlugInUrl:
             # Edge cases
             ("test", "/us/movie/testing/umc.123", False),  # "test" in "testing"
             ("", "/us/movie/anything/umc.123", False),  # Empty slug
+            ("", "https://tv.apple.com//us/movie/umc.123", False),
         ],
     )
     def test_slug_in_url(self, slug, url, expected):
@@ -42,6 +60,29 @@ class TestSlugInUrl:
         assert result == expected, f"Expected {expected} for slug '{slug}' in URL '{url}'"
 
 
+class TestItunesContentUrlRe:
+    """Tests for the iTunes track URL pattern."""
+
+    @pytest.mark.parametrize(
+        "url,expected",
+        [
+            ("https://itunes.apple.com/us/movie/dune/id123", True),
+            ("https://itunes.apple.com/movie/dune/id123", True),
+            ("https://itunes.apple.com/us/tv-season/show/id456?i=1", True),
+            ("https://itunes.apple.com/tv-season/show/id456", True),
+            ("https://apple.com/us/movie/dune/id123", True),
+            ("https://itunes.apple.com/us/album/x/id1?next=/movie/", False),
+            ("https://itunes.apple.com/us/album/x/id1#/movie/", False),
+            ("https://apple.com.evil.com/us/movie/dune/id123", False),
+            ("https://example.com/us/movie/dune/id123", False),
+            ("https://notapple.com/movie/dune/id123", False),
+        ],
+    )
+    def test_itunes_content_url(self, url, expected):
+        """Test which iTunes track URLs are treated as content pages."""
+        assert bool(_ITUNES_CONTENT_URL_RE.match(url)) == expected
+
+
 class TestNormalizeTitle:
     """Tests for _normalize_title function."""
 
@@ -81,6 +122,9 @@ class TestTitleToSlug:
             ("", ""),
             # Additional tests for movies with issues
             ("Predator: Badlands", "predator-badlands"),
+            # Accented characters are reduced to ASCII
+            ("Pokémon: Détective Pikachu", "pokemon-detective-pikachu"),
+            ("Amélie", "amelie"),
         ],
     )
     def test_title_to_slug(self, title, expected):
@@ -187,6 +231,23 @@ class TestFindContentUrlInData:
         result = _find_content_url_in_data(data, "predator-badlands", "movie")
         assert result == "https://tv.apple.com/us/movie/predator-badlands/umc.cmc.5k20n1ox51cwgge4sr476fr6p"
 
+    def test_returns_first_match_in_order(self):
+        """Test that the first matching URL in document order is returned."""
+        data = [
+            {"items": [{"url": "/us/movie/test-movie/umc.cmc.first"}]},
+            {"url": "/us/movie/test-movie/umc.cmc.second"},
+        ]
+        result = _find_content_url_in_data(data, "test-movie", "movie")
+        assert result == "https://tv.apple.com/us/movie/test-movie/umc.cmc.first"
+
+    def test_deeply_nested_data(self):
+        """Test that deeply nested data does not hit the recursion limit."""
+        data: dict = {"url": "/us/movie/test-movie/umc.cmc.deep"}
+        for _ in range(5000):
+            data = {"child": [data]}
+        result = _find_content_url_in_data(data, "test-movie", "movie")
+        assert result == "https://tv.apple.com/us/movie/test-movie/umc.cmc.deep"
+
     def test_no_match_found(self):
         """Test when no matching URL is found."""
         data = {"url": "/us/movie/other-movie/umc.cmc.12345"}
@@ -215,7 +276,7 @@ class TestSearchWebForAppleTvUrl:
 
     def test_returns_none_on_http_error(self, mocker):
         """Test that HTTP errors are handled gracefully."""
-        mock_get = mocker.patch("core.download.apple.search.requests.get")
+        mock_get = mocker.patch("core.download.apple.search._session.get")
         mock_get.return_value.status_code = 500
 
         result = search_web_for_apple_tv_url("Test Movie", 2024, True)
@@ -237,7 +298,7 @@ class TestSearchWebForAppleTvUrl:
         mock_response.status_code = 200
         mock_response.text = html_response
 
-        mock_get = mocker.patch("core.download.apple.search.requests.get")
+        mock_get = mocker.patch("core.download.apple.search._session.get")
         mock_get.return_value = mock_response
 
         result = search_web_for_apple_tv_url("Test Movie", 2024, True)
@@ -259,7 +320,7 @@ class TestSearchWebForAppleTvUrl:
         mock_response.status_code = 200
         mock_response.text = html_response
 
-        mock_get = mocker.patch("core.download.apple.search.requests.get")
+        mock_get = mocker.patch("core.download.apple.search._session.get")
         mock_get.return_value = mock_response
 
         result = search_web_for_apple_tv_url("Test Movie", 2024, True)
@@ -280,8 +341,170 @@ class TestSearchWebForAppleTvUrl:
         mock_response.status_code = 200
         mock_response.text = html_response
 
-        mock_get = mocker.patch("core.download.apple.search.requests.get")
+        mock_get = mocker.patch("core.download.apple.search._session.get")
         mock_get.return_value = mock_response
 
         result = search_web_for_apple_tv_url("Test Show", 2024, is_movie=False)
         assert result == "https://tv.apple.com/us/show/test-show/umc.cmc.abc123"
+
+    def test_prefers_result_links_over_other_links(self, mocker):
+        """Test that result links win over ads and display URLs."""
+        html_response = '''
+        <a class="badge--ad" href="https://tv.apple.com/us/movie/test-movie/umc.cmc.ad">
+            Ad
+        </a>
+        <a class="result__url" href="//duckduckgo.com/l/?uddg=x">
+            tv.apple.com/us/movie/test-movie/umc.cmc.display
+        </a>
+        <a rel="nofollow" class="result__a" href="//duckduckgo.com/l/?uddg=https%3A%2F%2Ftv.apple.com%2Fus%2Fmovie%2Ftest-movie%2Fumc.cmc.abc123&amp;rut=1">
+            Test Movie - Apple TV
+        </a>
+        '''
+        mock_get = mocker.patch("core.download.apple.search._session.get")
+        mock_get.return_value.status_code = 200
+        mock_get.return_value.text = html_response
+
+        result = search_web_for_apple_tv_url("Test Movie", 2024, True)
+        assert result == "https://tv.apple.com/us/movie/test-movie/umc.cmc.abc123"
+
+    def test_falls_back_to_display_url_then_any_link(self, mocker):
+        """Test that display URLs are checked before any other link."""
+        ad_link = '''
+        <a class="badge--ad" href="https://tv.apple.com/us/movie/test-movie/umc.cmc.ad">
+            Ad
+        </a>
+        '''
+        display_link = '''
+        <a class="result__url" href="//duckduckgo.com/l/?uddg=x">
+            <b>tv.apple.com</b>/us/movie/test-movie/umc.cmc.display
+        </a>
+        '''
+        mock_get = mocker.patch("core.download.apple.search._session.get")
+        mock_get.return_value.status_code = 200
+
+        mock_get.return_value.text = ad_link + display_link
+        result = search_web_for_apple_tv_url("Test Movie", 2024, True)
+        assert result == "https://tv.apple.com/us/movie/test-movie/umc.cmc.display"
+
+        search_web_for_apple_tv_url.cache_clear()
+        mock_get.return_value.text = ad_link
+        result = search_web_for_apple_tv_url("Test Movie", 2024, True)
+        assert result == "https://tv.apple.com/us/movie/test-movie/umc.cmc.ad"
+
+    def test_found_url_cache_expires_and_evicts(self, mocker):
+        """Test that expired URLs are refetched and old URLs are evicted."""
+        mocker.patch("core.download.apple.search.FOUND_URL_CACHE_SIZE", 2)
+        mock_monotonic = mocker.patch(
+            "core.download.apple.search.time.monotonic", return_value=0.0
+        )
+        mock_get = mocker.patch("core.download.apple.search._session.get")
+        mock_get.return_value.status_code = 200
+
+        def ddg_result(slug):
+            return (
+                '<a class="result__a" href="//duckduckgo.com/l/?uddg='
+                f'https%3A%2F%2Ftv.apple.com%2Fus%2Fmovie%2F{slug}'
+                '%2Fumc.cmc.abc123">Apple TV</a>'
+            )
+
+        for title, slug in [
+            ("Movie A", "movie-a"),
+            ("Movie B", "movie-b"),
+            ("Movie C", "movie-c"),
+        ]:
+            mock_get.return_value.text = ddg_result(slug)
+            assert search_web_for_apple_tv_url(title, 2024, True)
+        assert mock_get.call_count == 3
+
+        # Movie A was evicted when Movie C was added, Movie C is still cached
+        mock_get.return_value.text = ddg_result("movie-a")
+        search_web_for_apple_tv_url("Movie A", 2024, True)
+        search_web_for_apple_tv_url("Movie A", 2024, True)
+        assert mock_get.call_count == 4
+
+        # After the TTL the cached URL is dropped and looked up again
+        mock_monotonic.return_value = FOUND_URL_CACHE_TTL + 1
+        search_web_for_apple_tv_url("Movie A", 2024, True)
+        assert mock_get.call_count == 5
+
+    def test_reuses_found_url(self, mocker):
+        """Test that found URLs are cached and failed lookups are retried."""
+        html_response = '''
+        <a class="result__a" href="//duckduckgo.com/l/?uddg=https%3A%2F%2Ftv.apple.com%2Fus%2Fmovie%2Ftest-movie%2Fumc.cmc.abc123">
+            Test Movie - Apple TV
+        </a>
+        '''
+        mock_get = mocker.patch("core.download.apple.search._session.get")
+        mock_get.return_value.status_code = 500
+        assert search_web_for_apple_tv_url("Test Movie", 2024, True) is None
+
+        mock_get.return_value.status_code = 200
+        mock_get.return_value.text = html_response
+        first = search_web_for_apple_tv_url("Test Movie", 2024, True)
+        second = search_web_for_apple_tv_url("Test Movie", 2024, True)
+
+        assert first == "https://tv.apple.com/us/movie/test-movie/umc.cmc.abc123"
+        assert second == first
+        assert mock_get.call_count == 2
+
+
+class TestSearchForTrailerItunes:
+    """Tests for the iTunes fallback in search_for_trailer."""
+
+    def test_tries_results_past_excluded_top_matches(self, monkeypatch):
+        """Test that lower ranked iTunes results are tried when the top
+        ranked ones are excluded."""
+        itunes_results = [
+            {
+                "trackId": n,
+                "trackName": "Test Movie",
+                "trackViewUrl": (
+                    f"https://itunes.apple.com/us/movie/test-movie/id{n}"
+                ),
+            }
+            for n in range(1, 8)
+        ]
+        response = MagicMock()
+        response.status_code = 200
+        response.content = json.dumps({"results": itunes_results})
+        monkeypatch.setattr(
+            search._session, "get", MagicMock(return_value=response)
+        )
+        monkeypatch.setattr(search, "try_direct_slug_url", lambda *a: None)
+        monkeypatch.setattr(search, "search_apple_tv_api", lambda *a: [])
+        monkeypatch.setattr(search, "search_apple_tv_web", lambda *a: None)
+        monkeypatch.setattr(
+            search, "search_web_for_apple_tv_url", lambda *a: None
+        )
+
+        tried = []
+
+        def fetch_and_validate(content_url, title, year, exclude):
+            apple_id = content_url.rsplit("/", 1)[-1]
+            tried.append(apple_id)
+            if apple_id in exclude:
+                return None
+            return TrailerInfo(
+                hls_url=f"https://example.com/{apple_id}.m3u8",
+                video_title="Trailer",
+                content_title=title,
+                release_date="2024-01-01",
+                apple_id=apple_id,
+            )
+
+        monkeypatch.setattr(
+            search, "_fetch_and_validate_trailer", fetch_and_validate
+        )
+        media = MagicMock(spec=MediaRead)
+        media.title = "Test Movie"
+        media.year = 2024
+        media.is_movie = True
+        media.imdb_id = None
+        media.id = 1
+
+        exclude = [f"id{n}" for n in range(1, 7)]
+        trailer = search.search_for_trailer(media, exclude)
+
+        assert trailer is not None
+        assert trailer.apple_id == "id7"
+        assert tried == [f"id{n}" for n in range(1, 8)]
@@ -0,0 +1,207 @@
+"""Tests for the download_trailer function."""
+
+import datetime
+import threading
+from types import SimpleNamespace
+from unittest.mock import ANY, AsyncMock, MagicMock
+
+import pytest
+from core.base.database.models.media import MediaRead, MonitorStatus
+from core.download import trailer
+from core.download.apple.api import TrailerInfo
+from exceptions import DownloadFailedError
+
+
+def _make_media(**kwargs) -> MediaRead:
+    """Create a media object, overriding fields with kwargs."""
+    fields = dict(
+        id=1,
+        connection_id=1,
+        arr_id=1,
+        is_movie=True,
+        title="Test Movie",
+        clean_title="test movie",
+        year=2024,
+        language="en",
+        studio="Test Studio",
+        txdb_id="12345",
+        title_slug="test-movie",
+        trailer_exists=False,
+        monitor=True,
+        arr_monitored=True,
+        status=MonitorStatus.MONITORED,
+        media_exists=False,
+        media_filename="",
+        season_count=0,
+        runtime=120,
+        added_at=datetime.datetime(
+            2024, 1, 1, 0, 0, 0, tzinfo=datetime.timezone.utc
+        ),
+        updated_at=datetime.datetime(
+            2024, 1, 1, 0, 0, 0, tzinfo=datetime.timezone.utc
+        ),
+        downloaded_at=None,
+    )
+    fields.update(kwargs)
+    return MediaRead(**fields)
+
+
+def _make_trailer_info(apple_id: str) -> TrailerInfo:
+    """Create trailer info for the given Apple ID."""
+    return TrailerInfo(
+        hls_url=f"https://example.com/{apple_id}.m3u8",
+        video_title="Official Trailer",
+        content_title="Test Movie",
+        release_date="2024-01-01",
+        apple_id=apple_id,
+    )
+
+
+@pytest.fixture
+def profile():
+    """Create a mock trailer profile."""
+    profile = MagicMock()
+    profile.id = 1
+    profile.file_format = "mkv"
+    profile.stop_monitoring = False
+    return profile
+
+
+@pytest.fixture
+def mock_download(monkeypatch):
+    """Patch the download, file and database steps of download_trailer."""
+    mocks = SimpleNamespace(
+        download=AsyncMock(return_value="/tmp/1-trailer.mkv"),
+        media_manager=MagicMock(),
+        move=MagicMock(
+            return_value="/media/Test Movie/Test Movie-trailer.mkv"
+        ),
+        record=AsyncMock(),
+    )
+    monkeypatch.setattr(
+        trailer, "__download_and_verify_trailer", mocks.download
+    )
+    monkeypatch.setattr(trailer, "media_manager", mocks.media_manager)
+    monkeypatch.setattr(
+        trailer.trailer_file, "move_trailer_to_folder", mocks.move
+    )
+    monkeypatch.setattr(trailer, "record_new_trailer_download", mocks.record)
+    monkeypatch.setattr(
+        trailer.websockets.ws_manager, "broadcast", AsyncMock()
+    )
+    return mocks
+
+
+def _patch_search(monkeypatch, mock_search: MagicMock) -> MagicMock:
+    """Replace the trailer search with the given mock."""
+    monkeypatch.setattr(
+        trailer.trailer_search, "get_trailer_info", mock_search
+    )
+    return mock_search
+
+
+class TestDownloadTrailer:
+    """Tests for download_trailer retry and exclude handling."""
+
+    @pytest.mark.asyncio
+    async def test_downloads_search_result(
+        self, monkeypatch, profile, mock_download
+    ):
+        """Test that a found trailer is downloaded and recorded."""
+        search_threads = []
+
+        def get_trailer_info(media, profile, exclude):
+            search_threads.append(threading.current_thread())
+            return _make_trailer_info("umc.cmc.1")
+
+        _patch_search(monkeypatch, MagicMock(side_effect=get_trailer_info))
+
+        assert await trailer.download_trailer(_make_media(), profile)
+
+        mock_download.download.assert_awaited_once()
+        mock_download.record.assert_awaited_once_with(
+            ANY, 1, mock_download.move.return_value, "umc.cmc.1"
+        )
+        # Search runs blocking HTTP requests, so it must run off the loop
+        assert search_threads[0] is not threading.current_thread()
+
+    @pytest.mark.asyncio
+    async def test_failed_id_is_excluded_on_retry(
+        self, monkeypatch, profile, mock_download
+    ):
+        """Test that a failed Apple ID is excluded from the next search."""
+        excludes = []
+
+        def get_trailer_info(media, profile, exclude):
+            excludes.append(set(exclude))
+            return _make_trailer_info(f"umc.cmc.{len(excludes)}")
+
+        _patch_search(monkeypatch, MagicMock(side_effect=get_trailer_info))
+        mock_download.download.side_effect = [
+            DownloadFailedError("Trailer verification failed"),
+            "/tmp/1-trailer.mkv",
+        ]
+
+        assert await trailer.download_trailer(_make_media(), profile)
+
+        assert excludes == [set(), {"umc.cmc.1"}]
+        mock_download.record.assert_awaited_once_with(
+            ANY, 1, mock_download.move.return_value, "umc.cmc.2"
+        )
+
+    @pytest.mark.asyncio
+    async def test_raises_after_all_retries(
+        self, monkeypatch, profile, mock_download
+    ):
+        """Test that retry_count + 1 attempts are made before failing."""
+        mock_search = _patch_search(
+            monkeypatch,
+            MagicMock(return_value=_make_trailer_info("umc.cmc.1")),
+        )
+        mock_download.download.side_effect = DownloadFailedError("failed")
+
+        with pytest.raises(DownloadFailedError, match="Failed to download"):
+            await trailer.download_trailer(_make_media(), profile, retry_count=2)
+
+        assert mock_search.call_count == 3
+        assert mock_download.download.await_count == 3
+        # Media is set to downloading and then back to missing on each attempt
+        statuses = [
+            c.args[0].status
+            for c in mock_download.media_manager.update_media_status.call_args_list
+        ]
+        assert statuses == [
+            MonitorStatus.DOWNLOADING,
+            MonitorStatus.MISSING,
+        ] * 3
+
+    @pytest.mark.asyncio
+    async def test_manual_id_resolved_once(
+        self, monkeypatch, profile, mock_download
+    ):
+        """Test that a manual Apple ID is resolved once and used every attempt."""
+        manual_info = _make_trailer_info("umc.cmc.manual")
+        mock_manual = MagicMock(return_value=manual_info)
+        monkeypatch.setattr(trailer, "_get_trailer_from_manual_id", mock_manual)
+        mock_search = _patch_search(monkeypatch, MagicMock())
+        mock_download.download.side_effect = DownloadFailedError("failed")
+        media = _make_media(youtube_trailer_id="umc.cmc.manual")
+
+        with pytest.raises(DownloadFailedError):
+            await trailer.download_trailer(media, profile, retry_count=2)
+
+        mock_manual.assert_called_once_with("umc.cmc.manual", "Test Movie", True)
+        mock_search.assert_not_called()
+        assert [c.args[1] for c in mock_download.download.await_args_list] == [
+            manual_info
+        ] * 3
+
+    @pytest.mark.asyncio
+    async def test_no_trailer_found(self, monkeypatch, profile, mock_download):
+        """Test that an empty search result raises without downloading."""
+        _patch_search(monkeypatch, MagicMock(return_value=None))
+
+        with pytest.raises(DownloadFailedError, match="No trailer found"):
+            await trailer.download_trailer(_make_media(), profile)
+
+        mock_download.download.assert_not_awaited()
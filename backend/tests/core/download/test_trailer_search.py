@@ -15,6 +15,8 @@ from core.download.trailers.utils import extract_youtube_id
         ),
         # Short youtu.be URLs
         ("https://youtu.be/abcdefghijk", "abcdefghijk"),
+        ("https://youtu.be/abc-efgh_jk", "abc-efgh_jk"),
+        ("https://youtu.be/abcdefghijk?t=42", "abcdefghijk"),
         # Embed URLs
         ("https://www.youtube.com/embed/abcdefghijk", "abcdefghijk"),
         # /v/ URLs
@@ -29,6 +31,7 @@ from core.download.trailers.utils import extract_youtube_id
         # Invalid: wrong length
         ("https://www.youtube.com/watch?v=abcde", None),
         ("https://youtu.be/abcde", None),
+        ("https://youtu.be/abcdefghijk/extra", None),
         # Invalid: no video id
         ("https://www.youtube.com/", None),
         ("https://youtu.be/", None),
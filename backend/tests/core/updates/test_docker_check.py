@@ -0,0 +1,104 @@
+"""Tests for the update checker in core/updates/docker_check.py"""
+
+import pytest
+from aioresponses import aioresponses
+
+from core.updates import docker_check
+from core.updates.docker_check import (
+    _is_newer_version,
+    get_latest_image_version,
+    invalidate_latest_image_version,
+)
+
+IMAGE_NAME = "nandyalu/trailarr"
+RELEASE_URL = f"https://api.github.com/repos/{IMAGE_NAME}/releases/latest"
+
+
+@pytest.fixture(autouse=True)
+def clear_release_cache(monkeypatch):
+    """Start every test without any cached release info."""
+    monkeypatch.setattr(docker_check, "_release_etags", {})
+    invalidate_latest_image_version()
+
+
+class TestGetLatestImageVersion:
+    """Tests for the get_latest_image_version function."""
+
+    @pytest.mark.asyncio
+    async def test_returns_tag_name(self):
+        """Test that the release tag is returned from the API response."""
+        with aioresponses() as m:
+            m.get(RELEASE_URL, status=200, payload={"tag_name": "v0.6.8"})
+            result = await get_latest_image_version(IMAGE_NAME)
+
+        assert result == "v0.6.8"
+
+    @pytest.mark.asyncio
+    async def test_not_modified_returns_cached_tag(self):
+        """Test that a 304 response reuses the tag cached with the ETag."""
+        with aioresponses() as m:
+            m.get(
+                RELEASE_URL,
+                status=200,
+                payload={"tag_name": "v0.6.8"},
+                headers={"ETag": '"abc123"'},
+            )
+            m.get(RELEASE_URL, status=304)
+            await get_latest_image_version(IMAGE_NAME)
+            invalidate_latest_image_version()
+            result = await get_latest_image_version(IMAGE_NAME)
+
+            request = list(m.requests.values())[0][1]
+        assert result == "v0.6.8"
+        assert request.kwargs["headers"]["If-None-Match"] == '"abc123"'
+
+    @pytest.mark.asyncio
+    async def test_reuses_recent_tag_without_request(self):
+        """Test that a recently fetched tag is returned from the cache."""
+        with aioresponses() as m:
+            m.get(RELEASE_URL, status=200, payload={"tag_name": "v0.6.8"})
+            await get_latest_image_version(IMAGE_NAME)
+            result = await get_latest_image_version(IMAGE_NAME)
+
+            request_count = len(list(m.requests.values())[0])
+        assert result == "v0.6.8"
+        assert request_count == 1
+
+    @pytest.mark.asyncio
+    async def test_returns_none_on_error(self):
+        """Test that API errors are handled gracefully."""
+        with aioresponses() as m:
+            m.get(RELEASE_URL, status=500)
+            result = await get_latest_image_version(IMAGE_NAME)
+
+        assert result is None
+
+
+class TestIsNewerVersion:
+    """Tests for the _is_newer_version function."""
+
+    @pytest.mark.parametrize(
+        "latest,current,expected",
+        [
+            ("v0.6.8", "v0.6.7", True),
+            ("v0.6.8", "0.6.7", True),
+            ("v0.10.0", "v0.9.9", True),
+            # Same version with different formatting is not an update
+            ("v0.6.7", "v0.6.7", False),
+            ("v0.6.7", "0.6.7", False),
+            # Older latest release is not an update
+            ("v0.6.7", "v0.6.8", False),
+            # Development build of the same version
+            ("v0.6.1", "0.6.1-dev", True),
+            # Unparseable versions fall back to string comparison
+            ("latest", "v0.6.7", True),
+            # Nightly builds are versioned by date, not release number
+            ("v0.6.8", "251015-nightly", True),
+            ("v0.6.8", "2510152359-nightly", True),
+            # Unversioned build (APP_VERSION not set)
+            ("v0.6.8", "0.0.0", True),
+        ],
+    )
+    def test_is_newer_version(self, latest, current, expected):
+        """Test version comparison between latest and current versions."""
+        assert _is_newer_version(latest, current) == expected